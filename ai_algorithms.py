@@ -134,31 +134,31 @@ def iddfs(start, goal, obstacles):
 def bidirectional_bfs(start, goal, obstacles):
     if start == goal:
         return [], set()
-    q1 = deque([[start]])
-    q2 = deque([[goal]])
+    q1 = deque([start])
+    q2 = deque([goal])
     visited1 = {start: [start]}
     visited2 = {goal: [goal]}
 
+    def expand_layer(queue, visited, other):
+        # Expand a whole layer so the first meeting found is the shortest one
+        meet = None
+        for _ in range(len(queue)):
+            node = queue.popleft()
+            for neighbor in get_neighbors(node):
+                if neighbor in visited or neighbor in obstacles:
+                    continue
+                visited[neighbor] = visited[node] + [neighbor]
+                queue.append(neighbor)
+                if neighbor in other and (meet is None or len(other[neighbor]) < len(other[meet])):
+                    meet = neighbor
+        return meet
+
     while q1 and q2:
-        path1 = q1.popleft()
-        path2 = q2.popleft()
-        end1 = path1[-1]
-        end2 = path2[-1]
-
-        if end1 in visited2:
-            return path1[1:] + visited2[end1][::-1], set(visited1.keys()).union(visited2.keys())
-        if end2 in visited1:
-            return visited1[end2][1:] + path2[::-1], set(visited1.keys()).union(visited2.keys())
-
-        for neighbor in get_neighbors(end1):
-            if neighbor not in visited1 and neighbor not in obstacles:
-                visited1[neighbor] = path1 + [neighbor]
-                q1.append(path1 + [neighbor])
-
-        for neighbor in get_neighbors(end2):
-            if neighbor not in visited2 and neighbor not in obstacles:
-                visited2[neighbor] = path2 + [neighbor]
-                q2.append(path2 + [neighbor])
+        meet = expand_layer(q1, visited1, visited2)
+        if meet is None:
+            meet = expand_layer(q2, visited2, visited1)
+        if meet is not None:
+            return visited1[meet][1:] + visited2[meet][-2::-1], set(visited1.keys()).union(visited2.keys())
 
     return [], set()
 
@@ -0,0 +1,62 @@
+import json
+import os
+
+import pytest
+
+# The suite never opens a window, but keep SDL headless in case pygame is imported
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+# test_pygame.py is an interactive window check, not a pytest module
+collect_ignore = ["test_pygame.py"]
+
+BASELINE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "benchmark_baselines.json")
+
+_recorded = {}
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--update-baselines",
+        action="store_true",
+        default=False,
+        help="Record benchmark timings and expansion counts into benchmark_baselines.json",
+    )
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "benchmark: timing and expansion-count regression checks")
+
+
+def load_baselines():
+    if not os.path.exists(BASELINE_FILE):
+        return {"results": {}}
+    with open(BASELINE_FILE) as f:
+        return json.load(f)
+
+
+@pytest.fixture(scope="session")
+def update_baselines(request):
+    return request.config.getoption("--update-baselines")
+
+
+@pytest.fixture(scope="session")
+def baselines():
+    return load_baselines()
+
+
+@pytest.fixture(scope="session")
+def benchmark_recorder():
+    return _recorded
+
+
+def pytest_sessionfinish(session, exitstatus):
+    if not session.config.getoption("--update-baselines") or not _recorded:
+        return
+    # Merge so that running a subset (-k) only refreshes the selected entries
+    data = load_baselines()
+    data["results"].update(_recorded)
+    data["results"] = dict(sorted(data["results"].items()))
+    with open(BASELINE_FILE, "w") as f:
+        json.dump(data, f, indent=2)
+        f.write("\n")
@@ -0,0 +1,218 @@
+import gc
+import os
+import random
+import time
+from collections import deque, namedtuple
+
+import pytest
+
+import ai_algorithms
+from ai_algorithms import ALL_ALGORITHMS
+
+# === Board Corpus ===
+Board = namedtuple("Board", "name width height seed start goal obstacles")
+
+# (name, width, height, seed, start, goal) -- start/goal of None are picked from the seed,
+# away from the edges, so the searches meet in the middle of the board
+BOARD_SPECS = [
+    ("small_8x8", 8, 8, 1, (0, 0), (7, 7)),
+    ("game_12x12", 12, 12, 2, (0, 0), (11, 11)),
+    ("wide_32x16", 32, 16, 3, (0, 0), (31, 15)),
+    ("medium_24x24", 24, 24, 4, (0, 0), (23, 23)),
+    ("large_48x48", 48, 48, 5, (0, 0), (47, 47)),
+    ("xlarge_96x96", 96, 96, 6, (0, 0), (95, 95)),
+    ("interior_a_12x12", 12, 12, 119, None, None),
+    ("interior_b_12x12", 12, 12, 181, None, None),
+    ("interior_20x14", 20, 14, 86, None, None),
+    ("interior_40x40", 40, 40, 10, None, None),
+    ("adjacent_11x2", 11, 2, 11, (9, 0), (9, 1)),
+    ("adjacent_12x12", 12, 12, 12, (5, 6), (6, 6)),
+    ("same_tile_12x12", 12, 12, 13, (4, 4), (4, 4)),
+]
+OBSTACLE_DENSITY = 0.2   # Roughly the game's 30 obstacles on 144 tiles
+
+# Algorithms that must always return a shortest path
+OPTIMAL_ALGORITHMS = {"BFS", "Dijkstra", "A*", "UCS", "Bidirectional BFS", "Jump Point Search"}
+
+# Incomplete searches that may give up on a reachable goal
+MAY_GIVE_UP = {"Hill Climbing", "Beam Search", "Random Walk", "Best Random"}
+
+# Exponential searches only run on boards up to this many tiles
+MAX_TILES = {"IDDFS": 12 * 12}
+
+# === Benchmark Settings ===
+REPEATS = 5
+TIME_TOLERANCE = float(os.environ.get("BENCHMARK_TIME_TOLERANCE", "0.5"))
+EXPANSION_TOLERANCE = float(os.environ.get("BENCHMARK_EXPANSION_TOLERANCE", "0.05"))
+TIME_SLACK_MS = 0.5   # Absorbs timer noise on sub-millisecond runs
+
+
+def reference_distance(width, height, start, goal, obstacles):
+    """Plain BFS over the grid, independent of ai_algorithms. None if unreachable."""
+    dist = {start: 0}
+    queue = deque([start])
+    while queue:
+        x, y = node = queue.popleft()
+        if node == goal:
+            return dist[node]
+        for nxt in ((x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)):
+            if 0 <= nxt[0] < width and 0 <= nxt[1] < height and nxt not in obstacles and nxt not in dist:
+                dist[nxt] = dist[node] + 1
+                queue.append(nxt)
+    return None
+
+
+def make_board(name, width, height, seed, start, goal):
+    rng = random.Random(seed)
+    if start is None:
+        interior = [(x, y) for x in range(1, width - 1) for y in range(1, height - 1)]
+        start, goal = rng.sample(interior, 2)
+    tiles = [(x, y) for x in range(width) for y in range(height) if (x, y) not in (start, goal)]
+    count = int(len(tiles) * OBSTACLE_DENSITY)
+    while True:
+        obstacles = frozenset(rng.sample(tiles, count))
+        if reference_distance(width, height, start, goal, obstacles) is not None:
+            return Board(name, width, height, seed, start, goal, obstacles)
+
+
+BOARDS = [make_board(*spec) for spec in BOARD_SPECS]
+ALGORITHMS = [ALL_ALGORITHMS[key] for key in sorted(ALL_ALGORITHMS, key=int)]
+
+
+def cases(names=None):
+    params = []
+    for board in BOARDS:
+        for name, func in ALGORITHMS:
+            if names is not None and name not in names:
+                continue
+            if board.width * board.height > MAX_TILES.get(name, float("inf")):
+                continue
+            params.append(pytest.param(name, func, board, id=f"{name}@{board.name}"))
+    return params
+
+
+@pytest.fixture
+def grid(monkeypatch):
+    """Resize the grid seen by ai_algorithms to match a corpus board."""
+    def resize(board):
+        monkeypatch.setattr(ai_algorithms, "GRID_WIDTH", board.width)
+        monkeypatch.setattr(ai_algorithms, "GRID_HEIGHT", board.height)
+    return resize
+
+
+def run(func, board):
+    # Seed the random-walk family per board without leaking into other tests
+    state = random.getstate()
+    random.seed(board.seed)
+    try:
+        return func(board.start, board.goal, board.obstacles)
+    finally:
+        random.setstate(state)
+
+
+# === Correctness ===
+@pytest.mark.parametrize("name, func, board", cases())
+def test_path_is_valid(grid, name, func, board):
+    grid(board)
+    path, _ = run(func, board)
+    if board.start == board.goal:
+        assert path == []
+        return
+    if not path:
+        assert name in MAY_GIVE_UP, f"{name} found no path to a reachable goal"
+        return
+    assert path[-1] == board.goal
+    prev = board.start
+    for step in path:
+        assert 0 <= step[0] < board.width and 0 <= step[1] < board.height
+        assert step not in board.obstacles
+        assert ai_algorithms.heuristic(prev, step) == 1, f"{prev} -> {step} is not a single move"
+        prev = step
+
+
+@pytest.mark.parametrize("name, func, board", cases(OPTIMAL_ALGORITHMS))
+def test_optimal_path_length(grid, name, func, board):
+    grid(board)
+    path, _ = run(func, board)
+    expected = reference_distance(board.width, board.height, board.start, board.goal, board.obstacles)
+    assert len(path) == expected
+
+
+@pytest.mark.parametrize("name", sorted(OPTIMAL_ALGORITHMS))
+def test_unreachable_goal(grid, name):
+    func = dict(ALGORITHMS)[name]
+    board = BOARDS[0]
+    walled = board.obstacles | {(board.width - 2, board.height - 1), (board.width - 1, board.height - 2)}
+    board = board._replace(obstacles=walled)
+    grid(board)
+    path, _ = run(func, board)
+    assert path == []
+
+
+# === Benchmarks ===
+def cpu_time_ms(func, *args):
+    t0 = time.process_time()
+    result = func(*args)
+    return (time.process_time() - t0) * 1000, result
+
+
+def calibration_workload():
+    """Fixed pure-Python workload, so baselines carry across machines."""
+    board = next(b for b in BOARDS if b.name == "large_48x48")
+    return reference_distance(board.width, board.height, board.start, board.goal, board.obstacles)
+
+
+def best_times_ms(func, *args, setup=None):
+    """Best CPU times of func and the calibration workload, interleaved so both see the same load.
+
+    setup runs untimed before each call to func; GC is paused as in timeit.
+    """
+    best = best_reference = float("inf")
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(REPEATS):
+            best_reference = min(best_reference, cpu_time_ms(calibration_workload)[0])
+            if setup is not None:
+                setup()
+            elapsed, result = cpu_time_ms(func, *args)
+            best = min(best, elapsed)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return best, max(best_reference, 1e-3), result
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("name, func, board", cases())
+def test_benchmark(grid, monkeypatch, baselines, benchmark_recorder, update_baselines, name, func, board):
+    grid(board)
+    rng = random.Random()
+    monkeypatch.setattr(ai_algorithms, "random", rng)   # Reseeded per repeat, outside the timer
+    elapsed_ms, reference_ms, (_, visited) = best_times_ms(
+        func, board.start, board.goal, board.obstacles, setup=lambda: rng.seed(board.seed)
+    )
+    key = f"{name}@{board.name}"
+
+    # Stored relative to the calibration workload rather than in raw ms
+    measured = {
+        "relative_time": round(elapsed_ms / reference_ms, 5),
+        "expansions": len(visited),
+    }
+    if update_baselines:
+        benchmark_recorder[key] = measured
+        return
+
+    baseline = baselines["results"].get(key)
+    if baseline is None:
+        pytest.skip(f"No baseline for {key}; run pytest --update-baselines")
+
+    max_expansions = baseline["expansions"] * (1 + EXPANSION_TOLERANCE)
+    assert measured["expansions"] <= max_expansions, (
+        f"{key} expanded {measured['expansions']} nodes, baseline {baseline['expansions']}"
+    )
+    expected_ms = baseline["relative_time"] * reference_ms
+    max_ms = expected_ms * (1 + TIME_TOLERANCE) + TIME_SLACK_MS
+    assert elapsed_ms <= max_ms, (
+        f"{key} took {elapsed_ms:.2f} ms, expected about {expected_ms:.2f} ms (limit {max_ms:.2f} ms)"
+    )